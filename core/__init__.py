@@ -6,10 +6,12 @@ Exports:
 - Compiler
 - ExperimentRunner
 - UILogger
+- Profiler, PROFILER
 """
 
 from .compiler import Compiler
 from .experiment import ExperimentRunner
 from .logger import UILogger
+from .profiler import Profiler, PROFILER
 
-__all__ = ["Compiler", "ExperimentRunner", "UILogger"]
+__all__ = ["Compiler", "ExperimentRunner", "UILogger", "Profiler", "PROFILER"]
@@ -0,0 +1,296 @@
+"""core.backends
+=================
+
+Reference Python implementations of every lab. They are used as a third
+method (``"PY"``) next to OMP/MPI to answer one question: is the parallel C++
+binary actually faster than a vectorized NumPy baseline? They also serve as
+quick correctness oracles for the binaries' output files.
+
+Quick example
+-------------
+from core.backends import BACKENDS, start_pool
+pool = start_pool(4)
+elapsed, value = BACKENDS["Integrate"](4, submethod="simp", integral_id=2,
+                                       pool=pool)
+pool.shutdown()
+print(f"Time: {elapsed}  I = {value}")
+
+Notes
+-----
+- Every backend has the signature ``fn(threads, submethod=None,
+  integral_id=None, pool=None)`` and returns ``(elapsed_seconds, result)``.
+  Only the computation is timed, the same way the C++ programs time only
+  the kernel.
+- Matrix uses NumPy BLAS ``matmul`` with the BLAS thread count limited by
+  ``threadpoolctl``. Without it the thread count cannot be controlled, so
+  ``unavailable("Matrix")`` reports an error instead of a flat sweep.
+- Integrate and Differentiation (``PROCESS_BACKENDS``) split the grid across
+  a ``ProcessPoolExecutor``. Workers exchange data through
+  ``multiprocessing.shared_memory`` instead of pickling arrays. One pool from
+  ``start_pool(max_threads)`` should be reused for a whole sweep; each run
+  submits only ``threads`` tasks to it. Without ``pool`` a temporary one is
+  created per call.
+- Pools always use the ``spawn`` start method: forking the GUI process from
+  a worker thread while Tk is running is unsafe.
+"""
+
+import math
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+try:
+    from threadpoolctl import threadpool_limits
+except ImportError:  # Matrix is reported as unavailable, see ``unavailable``
+    threadpool_limits = None
+
+
+# Same size as ``N`` in include/Matrix/matrix_omp.h
+MATRIX_N = 1000
+
+# Same ``n`` that ExperimentRunner passes to the integrate binaries
+INTEGRATE_N = 1000000
+
+# Grid size for the finite-difference lab
+DIFF_N = 5000000
+DIFF_A = 0.0
+DIFF_B = 2.0 * math.pi
+
+# Integration limits (a, b) per integral id, as in integrate_omp.cpp.
+# Integral 4 is even, so it is computed on [0, 2*PI] and doubled.
+INTEGRAL_LIMITS = {
+    1: (13.0 / 2.0, 3.0),
+    2: (2.0 * math.pi / 7.0, -2.0 * math.pi / 7.0),
+    3: (-1.0, -7.0),
+    4: (2.0 * math.pi, 0.0),
+}
+
+
+def integrand(integral_id, x):
+    """Vectorized counterpart of ``f(id, x)`` from integrate_omp.h."""
+    if integral_id == 1:
+        return 1.0 / np.sqrt(3 + 3 * x ** 2)
+    if integral_id == 2:
+        return np.exp(x) * np.sin(np.exp(x))
+    if integral_id == 3:
+        return 1.0 / (x ** 2 - 1)
+    if integral_id == 4:
+        return x * np.arctan(x) / np.sqrt(1 + x ** 2)
+    return x
+
+
+def diff_function(x):
+    """Function differentiated by the Differentiation lab."""
+    return np.sin(x) * np.exp(-x / 4.0)
+
+
+def diff_exact(x):
+    """Analytic derivative of :func:`diff_function`, used to check accuracy."""
+    return np.exp(-x / 4.0) * (np.cos(x) - np.sin(x) / 4.0)
+
+
+# ---------------------------------------------------------------- helpers
+def _chunks(n, parts):
+    """Split ``range(n)`` into ``parts`` contiguous ``(start, stop)`` bounds."""
+    bounds = np.linspace(0, n, parts + 1).astype(int)
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def _noop(_):
+    return None
+
+
+def start_pool(workers):
+    """Create a ``spawn`` pool and start all its workers before any timing."""
+    pool = ProcessPoolExecutor(max_workers=workers,
+                               mp_context=multiprocessing.get_context("spawn"))
+    list(pool.map(_noop, range(workers)))
+    return pool
+
+
+# ---------------------------------------------------------------- Matrix
+def matrix(threads, submethod=None, integral_id=None, pool=None):
+    """Multiply the lab matrices with BLAS limited to ``threads`` threads."""
+    i = np.arange(MATRIX_N, dtype=np.float64)[:, None]
+    j = np.arange(MATRIX_N, dtype=np.float64)[None, :]
+    a = i * i * i + j
+    b = 2.0 * i * j
+
+    with threadpool_limits(limits=threads, user_api="blas"):
+        start = time.perf_counter()
+        c = a @ b
+        elapsed = time.perf_counter() - start
+    return elapsed, c
+
+
+# ---------------------------------------------------------------- Integrate
+def _integrate_chunk(shm_name, slot, integral_id, submethod, lo, h, n, start, stop):
+    """Weighted sum of the integrand over grid nodes ``[start, stop)``.
+
+    The partial sum is written into ``slot`` of the shared ``float64`` array.
+    """
+    if submethod == "rect":
+        x = lo + (np.arange(start, stop) + 0.5) * h
+        weights = 1.0
+    else:
+        idx = np.arange(start, stop)
+        x = lo + idx * h
+        if submethod == "trap":
+            weights = np.ones(stop - start)
+            weights[(idx == 0) | (idx == n)] = 0.5
+        else:
+            weights = np.where(idx % 2 == 1, 4.0, 2.0)
+            weights[(idx == 0) | (idx == n)] = 1.0
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        partial = float(np.sum(weights * integrand(integral_id, x)))
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        np.ndarray((slot + 1,), dtype=np.float64, buffer=shm.buf)[slot] = partial
+    finally:
+        shm.close()
+
+
+def integrate(threads, submethod=None, integral_id=None, pool=None, n=INTEGRATE_N):
+    """Integrate ``integral_id`` with ``submethod`` using ``threads`` processes.
+
+    ``submethod`` is ``'rect'`` (midpoint), ``'trap'`` or ``'simp'``; the
+    sign convention and limits follow integrate_omp.cpp.
+    """
+    submethod = submethod or "rect"
+    integral_id = integral_id or 1
+    a, b = INTEGRAL_LIMITS.get(integral_id, (1.0, 0.0))
+    sign = 1.0 if a >= b else -1.0
+    lo, hi = min(a, b), max(a, b)
+    if submethod == "simp" and n % 2:
+        n += 1
+    h = (hi - lo) / n
+    # rect evaluates n midpoints, trap/simp evaluate n + 1 nodes
+    nodes = n if submethod == "rect" else n + 1
+
+    own_pool = pool is None
+    if own_pool:
+        pool = start_pool(threads)
+    shm = shared_memory.SharedMemory(create=True, size=threads * 8)
+    try:
+        partials = np.ndarray((threads,), dtype=np.float64, buffer=shm.buf)
+        partials[:] = 0.0
+        start = time.perf_counter()
+        futures = [
+            pool.submit(_integrate_chunk, shm.name, k, integral_id,
+                        submethod, lo, h, n, s, e)
+            for k, (s, e) in enumerate(_chunks(nodes, threads))
+        ]
+        for fut in futures:
+            fut.result()
+        total = float(partials.sum())
+        elapsed = time.perf_counter() - start
+        del partials
+    finally:
+        if own_pool:
+            pool.shutdown()
+        shm.close()
+        shm.unlink()
+
+    result = sign * h * total
+    if submethod == "simp":
+        result /= 3.0
+    if integral_id == 4:
+        result *= 2.0
+    return elapsed, result
+
+
+# ---------------------------------------------------------------- Differentiation
+def _diff_chunk(in_name, out_name, n, h, start, stop):
+    """Finite differences for nodes ``[start, stop)`` of the shared grid.
+
+    Interior nodes use the central difference, the two boundary nodes use
+    one-sided second-order formulas.
+    """
+    shm_in = shared_memory.SharedMemory(name=in_name)
+    shm_out = shared_memory.SharedMemory(name=out_name)
+    try:
+        y = np.ndarray((n,), dtype=np.float64, buffer=shm_in.buf)
+        dy = np.ndarray((n,), dtype=np.float64, buffer=shm_out.buf)
+        lo, hi = max(start, 1), min(stop, n - 1)
+        if lo < hi:
+            dy[lo:hi] = (y[lo + 1:hi + 1] - y[lo - 1:hi - 1]) / (2.0 * h)
+        if start == 0:
+            dy[0] = (-3.0 * y[0] + 4.0 * y[1] - y[2]) / (2.0 * h)
+        if stop == n:
+            dy[n - 1] = (3.0 * y[n - 1] - 4.0 * y[n - 2] + y[n - 3]) / (2.0 * h)
+        del y, dy
+    finally:
+        shm_in.close()
+        shm_out.close()
+
+
+def differentiation(threads, submethod=None, integral_id=None, pool=None, n=DIFF_N):
+    """Differentiate :func:`diff_function` on ``n`` nodes with ``threads`` processes."""
+    x = np.linspace(DIFF_A, DIFF_B, n)
+    h = x[1] - x[0]
+
+    own_pool = pool is None
+    if own_pool:
+        pool = start_pool(threads)
+    shm_in = shared_memory.SharedMemory(create=True, size=n * 8)
+    shm_out = shared_memory.SharedMemory(create=True, size=n * 8)
+    try:
+        y = np.ndarray((n,), dtype=np.float64, buffer=shm_in.buf)
+        y[:] = diff_function(x)
+        start = time.perf_counter()
+        futures = [
+            pool.submit(_diff_chunk, shm_in.name, shm_out.name, n, h, s, e)
+            for s, e in _chunks(n, threads)
+        ]
+        for fut in futures:
+            fut.result()
+        elapsed = time.perf_counter() - start
+        dy = np.ndarray((n,), dtype=np.float64, buffer=shm_out.buf).copy()
+        del y
+    finally:
+        if own_pool:
+            pool.shutdown()
+        for shm in (shm_in, shm_out):
+            shm.close()
+            shm.unlink()
+
+    return elapsed, dy
+
+
+def diff_report(dy, samples=1000):
+    """Summarize a Differentiation result for saving.
+
+    Returns the max abs error against :func:`diff_exact` and a table of
+    ``samples`` evenly spaced rows ``(x, dy, exact)``.
+    """
+    x = np.linspace(DIFF_A, DIFF_B, dy.size)
+    exact = diff_exact(x)
+    max_err = float(np.max(np.abs(dy - exact)))
+    idx = np.linspace(0, dy.size - 1, min(samples, dy.size)).astype(int)
+    return max_err, np.column_stack((x[idx], dy[idx], exact[idx]))
+
+
+# Backend per lab name, keyed like ``LABS`` in starter.py
+BACKENDS = {
+    "Matrix": matrix,
+    "Integrate": integrate,
+    "Differentiation": differentiation,
+}
+
+# Backends that need a process pool from ``start_pool``
+PROCESS_BACKENDS = {"Integrate", "Differentiation"}
+
+
+def unavailable(lab_name):
+    """Return why the backend of ``lab_name`` cannot run a sweep, or ``None``."""
+    if lab_name not in BACKENDS:
+        return f"Нет Python-реализации для {lab_name}"
+    if lab_name == "Matrix" and threadpool_limits is None:
+        return ("Не установлен threadpoolctl: число потоков BLAS не "
+                "ограничивается (pip install threadpoolctl)")
+    return None
@@ -28,6 +28,8 @@ import os
 import subprocess
 import shutil
 
+from .profiler import PROFILER
+
 
 class Compiler:
     """Safe, small wrapper to build OMP/MPI test programs.
@@ -35,11 +37,14 @@ class Compiler:
     Parameters
     - include_dir: path to project include files (passed as -I to the compiler)
     - logger: an object with `.info`, `.warn`, `.error`, `.success` methods
+    - profiler: :class:`core.profiler.Profiler` for harness spans
+      (defaults to the shared ``PROFILER``)
     """
 
-    def __init__(self, include_dir, logger):
+    def __init__(self, include_dir, logger, profiler=None):
         self.include_dir = include_dir
         self.log = logger
+        self.profiler = profiler or PROFILER
         self.check_dependencies()
 
     def check_dependencies(self):
@@ -77,8 +82,10 @@ class Compiler:
         self.log.info(f"Компиляция {os.path.basename(src_file)} → {exe_file}")
 
         try:
-            result = subprocess.run(
-                cmd, capture_output=True, text=True, timeout=120)
+            with self.profiler.span("compile", cat="build",
+                                    src=os.path.basename(src_file), method=method):
+                result = subprocess.run(
+                    cmd, capture_output=True, text=True, timeout=120)
         except subprocess.TimeoutExpired:
             self.log.error("⏱ Время компиляции превышено (120 сек).")
             return False
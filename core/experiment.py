@@ -1,8 +1,9 @@
 """core.experiment
 ====================
 
-Runner for executing OMP/MPI experiment binaries and plotting simple
-speedup/efficiency charts. The runner tries to be forgiving: it logs stderr,
+Runner for executing OMP/MPI experiment binaries (or the Python reference
+backends from :mod:`core.backends`) and plotting simple speedup/efficiency
+charts. The runner tries to be forgiving: it logs stderr,
 handles timeouts and uses ``None`` for runs that failed or timed out.
 
 Quick example
@@ -13,40 +14,59 @@ proj = "."
 runner = ExperimentRunner(log, proj)
 threads, times = runner.run("bin/matrix_omp.exe", method="OMP", max_threads=8)
 runner.plot_results("OMP", "Lab1", threads, times)
+threads, times = runner.run(None, method="PY", lab_name="Matrix", max_threads=8)
 
 Notes
 -----
 - The binary is expected to print a line containing ``Time: <number>``. The
   parser extracts the first occurrence and converts it to float.
 - Per-run timeouts are 60 seconds. Increase if your experiments are longer.
+- With ``method="PY"`` no binary is started: the backend for ``lab_name`` is
+  called in-process and its result of the last run is saved to
+  ``results/output/<lab>_py.txt`` (for Differentiation: max error and a
+  subsampled grid).
+- Every child run and harness stage (spawn, wait, parse, plot) is recorded
+  as a span of the runner's profiler, see :mod:`core.profiler`.
 """
 
 import os
 import subprocess
+import numpy as np
 import matplotlib.pyplot as plt
 
+from .backends import BACKENDS, PROCESS_BACKENDS, diff_report, start_pool, unavailable
+from .profiler import PROFILER
+
 
 class ExperimentRunner:
-    """Run OMP/MPI experiments and build plots.
+    """Run OMP/MPI/PY experiments and build plots.
 
     Parameters
     - logger: object with `.info`, `.warn`, `.error`, `.success` methods
     - project_dir: base path used for saving result graphics
+    - profiler: :class:`core.profiler.Profiler` for harness spans
+      (defaults to the shared ``PROFILER``)
     """
 
-    def __init__(self, logger, project_dir):
+    def __init__(self, logger, project_dir, profiler=None):
         self.log = logger
         self.project_dir = project_dir
+        self.profiler = profiler or PROFILER
 
-    def run(self, exe_path, method, submethod=None, integral_id=None, max_threads=28):
+    def run(self, exe_path, method, submethod=None, integral_id=None, max_threads=28,
+            lab_name=None):
         """
         Универсальный запуск эксперимента.
-        :param exe: путь к бинарнику
-        :param method: 'OMP' или 'MPI'
+        :param exe: путь к бинарнику (не используется для 'PY')
+        :param method: 'OMP', 'MPI' или 'PY'
         :param submethod: для Lab2 — 'rect', 'trap', 'simp'
         :param integral_id: для Lab2 — номер интеграла 1..4
+        :param lab_name: для 'PY' — имя лабораторной из ``BACKENDS``
         :return: threads, times
         """
+        if method == "PY":
+            return self._run_python(lab_name, submethod, integral_id, max_threads)
+
         if not os.path.exists(exe_path):
             self.log.error(f"Исполняемый файл не найден: {exe_path}")
             return []
@@ -66,14 +86,13 @@ class ExperimentRunner:
         for t in threads:
             self.log.info(f"▶ Запуск {method} с {t} потоками...")
             try:
-                if method == "OMP":
-                    env = os.environ.copy()
-                    env["OMP_NUM_THREADS"] = str(t)
-                    proc = subprocess.run(
-                        args, capture_output=True, text=True, env=env, timeout=60)
-                else:
-                    proc = subprocess.run(
-                        ["mpiexec", "-n", str(t)] + args, capture_output=True, text=True, timeout=60)
+                with self.profiler.span("child", cat="run", method=method, threads=t):
+                    if method == "OMP":
+                        env = os.environ.copy()
+                        env["OMP_NUM_THREADS"] = str(t)
+                        proc = self._spawn(args, env)
+                    else:
+                        proc = self._spawn(["mpiexec", "-n", str(t)] + args)
 
                 if proc.stderr:
                     self.log.warn(proc.stderr.strip() + proc.stderr +
@@ -96,16 +115,106 @@ class ExperimentRunner:
 
         return list(threads), times
 
-    def _parse_time(self, output: str):
-        for line in output.splitlines():
-            if "Time:" in line:
+    def _spawn(self, cmd, env=None, timeout=60):
+        """Run ``cmd`` like ``subprocess.run`` with separate spawn/wait spans.
+
+        Kills the child and re-raises ``TimeoutExpired`` after ``timeout``.
+        As in ``subprocess.run``, POSIX only waits for the killed child: its
+        grandchildren (e.g. ``mpiexec`` ranks) may still hold the pipes.
+        """
+        with self.profiler.span("spawn", cat="run"):
+            child = subprocess.Popen(cmd, stdout=subprocess.PIPE,
+                                     stderr=subprocess.PIPE, text=True, env=env)
+        with child, self.profiler.span("wait", cat="run", pid=child.pid):
+            try:
+                stdout, stderr = child.communicate(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                child.kill()
+                if os.name == "nt":
+                    child.communicate()
+                else:
+                    child.wait()
+                raise
+            except BaseException:
+                child.kill()
+                raise
+        return subprocess.CompletedProcess(cmd, child.returncode, stdout, stderr)
+
+    def _run_python(self, lab_name, submethod, integral_id, max_threads):
+        """Sweep the Python reference backend of ``lab_name`` over 1..max_threads."""
+        reason = unavailable(lab_name)
+        if reason:
+            self.log.error(reason)
+            return list(range(1, max_threads + 1)), [None] * max_threads
+        backend = BACKENDS[lab_name]
+
+        threads = range(1, max_threads + 1)
+        times = []
+        result = None
+
+        # One pool for the whole sweep; each run uses only ``t`` of its workers
+        pool = None
+        if lab_name in PROCESS_BACKENDS:
+            self.log.info(f"Запуск пула из {max_threads} процессов...")
+            try:
+                with self.profiler.span("start_pool", cat="run", workers=max_threads):
+                    pool = start_pool(max_threads)
+            except Exception as e:
+                self.log.error(f"Ошибка запуска пула: {e}")
+                return list(threads), [None] * max_threads
+
+        try:
+            for t in threads:
+                self.log.info(f"▶ Запуск PY с {t} потоками...")
                 try:
-                    return float(line.split("Time:")[1].strip())
-                except ValueError:
-                    return None
-        return None
+                    with self.profiler.span("child", cat="run", method="PY", threads=t):
+                        t_val, result = backend(t, submethod, integral_id, pool=pool)
+                    times.append(t_val)
+                    self.log.info(f"Время: {t_val:.4f} сек")
+                except Exception as e:
+                    self.log.error(f"Ошибка запуска: {e}")
+                    times.append(None)
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+        if result is not None:
+            self._save_python_result(lab_name, result)
+        return list(threads), times
+
+    def _save_python_result(self, lab_name, result):
+        """Write the backend result like the binaries do, for comparing outputs.
+
+        Differentiation produces millions of values, so only its max error and
+        a subsampled grid are written.
+        """
+        out_dir = os.path.join(self.project_dir, "results", "output")
+        os.makedirs(out_dir, exist_ok=True)
+        out_path = os.path.join(out_dir, f"{lab_name.lower()}_py.txt")
+        if lab_name == "Differentiation":
+            max_err, table = diff_report(result)
+            np.savetxt(out_path, table, fmt="%.12g",
+                       header=f"max abs error: {max_err:.6g}\nx dy exact")
+            self.log.info(f"Макс. погрешность производной: {max_err:.3e}")
+        else:
+            np.savetxt(out_path, np.atleast_1d(result), fmt="%.12g")
+        self.log.info(f"Результат сохранён: {out_path}")
+
+    def _parse_time(self, output: str):
+        with self.profiler.span("parse", cat="run"):
+            for line in output.splitlines():
+                if "Time:" in line:
+                    try:
+                        return float(line.split("Time:")[1].strip())
+                    except ValueError:
+                        return None
+            return None
 
     def plot_results(self, method, lab_name, threads, times):
+        with self.profiler.span("plot_results", cat="plot", method=method):
+            self._plot_results(method, lab_name, threads, times)
+
+    def _plot_results(self, method, lab_name, threads, times):
         valid = [(t, v) for t, v in zip(threads, times) if v is not None]
         if not valid:
             self.log.warn("Нет корректных данных для построения графика.")
@@ -4,12 +4,14 @@ import datetime
 import tkinter as tk
 from tkinter.scrolledtext import ScrolledText
 
+from .profiler import PROFILER
+
 
 # This class is a logger that outputs messages to both Tkinter GUI and the console.
 class UILogger:
     """Логгер с выводом в Tkinter и консоль."""
 
-    def __init__(self, text_widget: ScrolledText = None):
+    def __init__(self, text_widget: ScrolledText = None, profiler=None):
         """
         The function initializes an object with a text widget attribute that defaults to None.
         
@@ -18,8 +20,12 @@ class UILogger:
         means that if no value is provided for `text_widget` when creating an instance of the class
         
         :type text_widget: ScrolledText
+
+        :param profiler: The `profiler` parameter is a `core.profiler.Profiler` that records the time
+        spent on writing each message; defaults to the shared `PROFILER`
         """
         self.text_widget = text_widget
+        self.profiler = profiler or PROFILER
 
     def log(self, message: str, level: str = "INFO"):
         """
@@ -39,13 +45,14 @@ class UILogger:
         
         :type level: str (optional)
         """
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-        formatted = f"[{timestamp}] [{level}] {message}"
-        print(formatted)
-        if self.text_widget:
-            self.text_widget.insert(tk.END, formatted + "\n")
-            self.text_widget.see(tk.END)
-            self.text_widget.update_idletasks()
+        with self.profiler.span("log", cat="ui", level=level):
+            timestamp = datetime.datetime.now().strftime("%H:%M:%S")
+            formatted = f"[{timestamp}] [{level}] {message}"
+            print(formatted)
+            if self.text_widget:
+                self.text_widget.insert(tk.END, formatted + "\n")
+                self.text_widget.see(tk.END)
+                self.text_widget.update_idletasks()
 
     def info(self, msg): self.log(msg, "INFO")
     def warn(self, msg): self.log(msg, "WARN")
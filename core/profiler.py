@@ -0,0 +1,192 @@
+"""core.profiler
+=================
+
+Lightweight self-profiling for the harness. Spans are recorded around every
+harness stage (compile, process spawn, waiting on the child, time parsing,
+plotting, UI logging) and every child run, then exported as Chrome
+trace-event JSON (open it in ``chrome://tracing`` or https://ui.perfetto.dev)
+and as a plain-text summary table.
+
+Quick example
+-------------
+from core.profiler import Profiler
+prof = Profiler(enabled=True)
+with prof.span("compile", cat="build", src="matrix_omp.cpp"):
+    ...
+prof.export_chrome_trace("results/profile/trace.json")
+print(prof.summary())
+
+Notes
+-----
+- A disabled profiler returns a shared no-op context manager from ``span``,
+  so instrumentation costs one attribute check per call.
+- ``PROFILER`` is the instance shared by ``Compiler``, ``ExperimentRunner``
+  and ``UILogger`` by default. It is enabled by the ``LAB_PROFILE``
+  environment variable; ``""``, ``"0"`` and ``"false"`` mean disabled.
+- Hooks added with ``add_hook`` are called with every finished event dict
+  (Chrome trace format) from the thread that closed the span.
+- Each thread gets a unique trace ``tid`` on its first span (CPython reuses
+  ``thread.ident`` after a thread exits, which would merge tracks).
+- Events accumulate for the whole session (all tabs) until ``clear``; the
+  trace and the summary are cumulative so concurrent runs can be compared.
+"""
+
+import itertools
+import json
+import os
+import threading
+import time
+from contextlib import nullcontext
+
+
+_NULL_SPAN = nullcontext()
+
+
+class _Span:
+    """Context manager recording one complete ("X") trace event."""
+
+    __slots__ = ("profiler", "name", "cat", "args", "start")
+
+    def __init__(self, profiler, name, cat, args):
+        self.profiler = profiler
+        self.name = name
+        self.cat = cat
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter_ns()
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        self.profiler._record(self.name, self.cat, self.start, end, self.args)
+        return False
+
+
+class Profiler:
+    """Collect harness spans and export them.
+
+    Parameters
+    - enabled: start recording immediately; can be toggled later via
+      the ``enabled`` attribute
+    """
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.events = []
+        self._hooks = []
+        self._threads = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._next_tid = itertools.count(1)
+        self._origin = time.perf_counter_ns()
+
+    def span(self, name, cat="harness", **args):
+        """Return a context manager timing the enclosed block as ``name``."""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, cat, args)
+
+    def add_hook(self, hook):
+        """Call ``hook(event)`` for every finished span."""
+        self._hooks.append(hook)
+
+    def clear(self):
+        """Drop all recorded events."""
+        with self._lock:
+            self.events.clear()
+
+    def _tid(self):
+        """Return this thread's unique trace id, registering it on first use."""
+        tid = getattr(self._local, "tid", None)
+        if tid is None:
+            with self._lock:
+                tid = next(self._next_tid)
+                self._threads[tid] = threading.current_thread().name
+            self._local.tid = tid
+        return tid
+
+    def _record(self, name, cat, start, end, args):
+        tid = self._tid()
+        event = {
+            "name": name,
+            "cat": cat,
+            "ph": "X",
+            "ts": (start - self._origin) / 1000.0,
+            "dur": (end - start) / 1000.0,
+            "pid": os.getpid(),
+            "tid": tid,
+            "args": args,
+        }
+        with self._lock:
+            self.events.append(event)
+        for hook in self._hooks:
+            hook(event)
+
+    def export_chrome_trace(self, path):
+        """Write recorded events as Chrome trace-event JSON to ``path``.
+
+        Events are copied under the lock and written without it, so recording
+        spans is not blocked by the export. Each thread writes its own
+        temporary file and moves it into place atomically, so concurrent
+        exports never interleave.
+        """
+        with self._lock:
+            events = list(self.events)
+            threads = dict(self._threads)
+        pid = os.getpid()
+        meta = [
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid,
+             "args": {"name": name}}
+            for tid, name in threads.items()
+        ]
+        out_dir = os.path.dirname(path)
+        if out_dir:
+            os.makedirs(out_dir, exist_ok=True)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": meta + events,
+                       "displayTimeUnit": "ms"}, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+        return path
+
+    def summary(self):
+        """Return a table of count/total/mean/max time per span name.
+
+        Covers every event recorded since the last ``clear``.
+        """
+        with self._lock:
+            events = list(self.events)
+        if not events:
+            return "Нет данных профилирования."
+
+        stats = {}
+        for e in events:
+            key = (e["cat"], e["name"])
+            count, total, peak = stats.get(key, (0, 0.0, 0.0))
+            stats[key] = (count + 1, total + e["dur"], max(peak, e["dur"]))
+
+        wall = (max(e["ts"] + e["dur"] for e in events)
+                - min(e["ts"] for e in events)) / 1000.0
+        lines = [
+            f"Сводка за сессию (все вкладки). Wall: {wall:.1f} ms, "
+            f"threads: {len({e['tid'] for e in events})}",
+            f"{'cat':<10} {'span':<16} {'count':>7} {'total ms':>11} "
+            f"{'mean ms':>10} {'max ms':>10}",
+        ]
+        for (cat, name), (count, total, peak) in sorted(
+                stats.items(), key=lambda kv: kv[1][1], reverse=True):
+            lines.append(
+                f"{cat:<10} {name:<16} {count:>7} {total / 1000.0:>11.2f} "
+                f"{total / count / 1000.0:>10.3f} {peak / 1000.0:>10.3f}")
+        return "\n".join(lines)
+
+
+def _env_enabled(name):
+    """Return ``True`` unless ``name`` is unset, empty, ``0`` or ``false``."""
+    return os.environ.get(name, "").strip().lower() not in ("", "0", "false")
+
+
+PROFILER = Profiler(enabled=_env_enabled("LAB_PROFILE"))
@@ -4,7 +4,7 @@ import os
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext, Toplevel
 import threading
-from core import Compiler, ExperimentRunner, UILogger
+from core import Compiler, ExperimentRunner, UILogger, PROFILER
 import matplotlib.pyplot as plt
 import matplotlib.image as mpimg
 
@@ -61,11 +61,11 @@ class LabTab:
         # --- Верхнее текстовое поле (лог) ---
         self.output.grid(row=0, column=0, columnspan=2, pady=10, sticky="ew")
 
-        # --- Выбор метода OMP/MPI ---
-        method_frame = ttk.LabelFrame(self.frame, text="Выбор метода (OMP/MPI)")
+        # --- Выбор метода OMP/MPI/PY ---
+        method_frame = ttk.LabelFrame(self.frame, text="Выбор метода (OMP/MPI/PY)")
         method_frame.grid(row=1, column=0, columnspan=2,
                         sticky="w", padx=10, pady=5)
-        for i, method in enumerate(["OMP", "MPI"]):
+        for i, method in enumerate(["OMP", "MPI", "PY"]):
             tk.Radiobutton(method_frame,
                         text=method,
                         variable=self.method_var,
@@ -137,6 +137,9 @@ class LabTab:
         :return: If the `src_file` is not found, the function will return without further execution.
         """
         method = self.method_var.get()
+        if method == "PY":
+            self.logger.info("Python-реализация не требует сборки.")
+            return
         exe = self.lab_info[f"{method}_EXE"]
         src_dir = self.lab_info["SRC_DIR"]
 
@@ -177,7 +180,19 @@ class LabTab:
         plots the results, and displays a graph window.
         """
         method = self.method_var.get()
-        exe = self.lab_info[f"{method}_EXE"]
+        with PROFILER.span("experiment", cat="gui", lab=self.lab_name, method=method):
+            self._run_experiment(method)
+        self.is_running = False
+        self._export_profile()
+
+    def _run_experiment(self, method):
+        """
+        The function runs the sweep for the selected method, then fills the table and shows the
+        graph.
+
+        :param method: Method is the name of the selected method ('OMP', 'MPI' or 'PY')
+        """
+        exe = self.lab_info.get(f"{method}_EXE")
         if self.lab_name == "Integrate":
             submethod = self.submethod_var.get()
             integral_mapping = {
@@ -189,14 +204,27 @@ class LabTab:
             integral_id = integral_mapping.get(self.integral_var.get(), 1)
 
             # Запуск через ExperimentRunner.run с аргументами
-            threads, times = self.runner.run(exe, method, submethod, integral_id)
+            threads, times = self.runner.run(exe, method, submethod, integral_id,
+                                             lab_name=self.lab_name)
         else:
-            threads, times = self.runner.run(exe, method)
+            threads, times = self.runner.run(exe, method, lab_name=self.lab_name)
 
-        self._update_table(threads, times)
+        with PROFILER.span("update_table", cat="gui"):
+            self._update_table(threads, times)
         self.runner.plot_results(method, self.lab_name, threads, times)
         self._show_graph_window(method, threads, times)
-        self.is_running = False
+
+    def _export_profile(self):
+        """
+        The function saves the harness trace (Chrome trace-event JSON) and logs a summary table
+        when profiling is enabled via the `LAB_PROFILE` environment variable. Both cover the whole
+        session across all tabs, so overlapping experiments can be compared.
+        """
+        if not PROFILER.enabled:
+            return
+        out_path = os.path.join(self.project_dir, "results", "profile", "trace.json")
+        PROFILER.export_chrome_trace(out_path)
+        self.logger.info(f"Профиль сессии сохранён: {out_path}\n{PROFILER.summary()}")
 
     def _update_table(self, threads, times):
         """
@@ -260,18 +288,19 @@ class LabTab:
         out_path = os.path.join(
             out_dir, f"{self.lab_name.lower()}_{method.lower()}.png")
 
-        # --- Построение графика ---
-        plt.figure(figsize=(9, 5))
-        plt.plot([t for t, _ in valid], speedup, "o-", label="Ускорение Sₚ")
-        plt.plot([t for t, _ in valid], efficiency, "x-",
-                 color="red", label="Эффективность Eₚ")
-        plt.xlabel("Количество потоков / процессов")
-        plt.ylabel("Значение")
-        plt.title(f"Результаты ({method}) — {self.lab_name}")
-        plt.grid(True)
-        plt.legend()
-        plt.tight_layout()
-        plt.savefig(out_path)
+        # --- Построение графика (plt.show ниже ждёт пользователя и не замеряется) ---
+        with PROFILER.span("show_graph", cat="plot", method=method):
+            plt.figure(figsize=(9, 5))
+            plt.plot([t for t, _ in valid], speedup, "o-", label="Ускорение Sₚ")
+            plt.plot([t for t, _ in valid], efficiency, "x-",
+                     color="red", label="Эффективность Eₚ")
+            plt.xlabel("Количество потоков / процессов")
+            plt.ylabel("Значение")
+            plt.title(f"Результаты ({method}) — {self.lab_name}")
+            plt.grid(True)
+            plt.legend()
+            plt.tight_layout()
+            plt.savefig(out_path)
         self.logger.success(f"📈 График сохранён: {out_path}")
 
         # --- Показ пользователю ---